@@ -5,14 +5,15 @@ from sqlalchemy import pool
 
 from alembic import context
 from app.models import Base
-from app.config import settings
+from app.database import get_database_url
 
 # this is the Alembic Config object, which provides
 # access to the values within the .ini file in use.
 config = context.config
+# Migrations run synchronously through psycopg (v3); '%' is doubled for configparser interpolation
 config.set_main_option(
     "sqlalchemy.url",
-    f"postgresql://{settings.database_user}:{settings.database_password}@{settings.database_host}:{settings.database_port}/{settings.database_name}"
+    get_database_url("postgresql+psycopg").render_as_string(hide_password=False).replace("%", "%%")
 )
 
 # Interpret the config file for Python logging.
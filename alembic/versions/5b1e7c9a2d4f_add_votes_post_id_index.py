@@ -0,0 +1,30 @@
+"""add votes post_id index
+
+Revision ID: 5b1e7c9a2d4f
+Revises: 33c5a215a75c
+Create Date: 2026-10-15 09:12:41.508316
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '5b1e7c9a2d4f'
+down_revision: Union[str, Sequence[str], None] = '33c5a215a75c'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_index('votes_post_id_idx', 'votes', ['post_id'])
+    pass
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('votes_post_id_idx', table_name='votes')
+    pass
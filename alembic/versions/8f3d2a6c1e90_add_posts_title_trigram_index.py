@@ -0,0 +1,31 @@
+"""add posts title trigram index
+
+Revision ID: 8f3d2a6c1e90
+Revises: 5b1e7c9a2d4f
+Create Date: 2026-10-15 09:47:03.219874
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '8f3d2a6c1e90'
+down_revision: Union[str, Sequence[str], None] = '5b1e7c9a2d4f'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+    op.execute("CREATE INDEX posts_title_trgm_idx ON posts USING gin (title gin_trgm_ops)")
+    pass
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.execute("DROP INDEX posts_title_trgm_idx")
+    pass
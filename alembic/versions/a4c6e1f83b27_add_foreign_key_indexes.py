@@ -0,0 +1,35 @@
+"""add foreign key indexes
+
+Revision ID: a4c6e1f83b27
+Revises: 8f3d2a6c1e90
+Create Date: 2026-10-15 10:21:56.730142
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'a4c6e1f83b27'
+down_revision: Union[str, Sequence[str], None] = '8f3d2a6c1e90'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_index('ix_posts_owner_id', 'posts', ['owner_id'])
+    op.create_index('ix_votes_post_id_user_id', 'votes', ['post_id', 'user_id'], unique=True)
+    # post_id is the leading column of the new index, so the single-column one is redundant
+    op.drop_index('votes_post_id_idx', table_name='votes')
+    pass
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.create_index('votes_post_id_idx', 'votes', ['post_id'])
+    op.drop_index('ix_votes_post_id_user_id', table_name='votes')
+    op.drop_index('ix_posts_owner_id', table_name='posts')
+    pass
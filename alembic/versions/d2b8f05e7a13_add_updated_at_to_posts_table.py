@@ -0,0 +1,30 @@
+"""add updated_at to posts table
+
+Revision ID: d2b8f05e7a13
+Revises: a4c6e1f83b27
+Create Date: 2026-10-15 11:04:18.592047
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'd2b8f05e7a13'
+down_revision: Union[str, Sequence[str], None] = 'a4c6e1f83b27'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column('posts', sa.Column('updated_at', sa.TIMESTAMP(timezone=True), server_default=sa.text('now()'), nullable=False))
+    pass
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_column('posts', 'updated_at')
+    pass
@@ -1,4 +1,5 @@
-from pydantic_settings import BaseSettings
+from functools import lru_cache
+from pydantic_settings import BaseSettings, SettingsConfigDict
 
 class Settings(BaseSettings):
     database_host: str 
@@ -6,11 +7,23 @@ class Settings(BaseSettings):
     database_password: str
     database_name: str
     database_user: str
+    database_pool_size: int = 20
+    database_pool_overflow: int = 30
+    database_pool_timeout: int = 30
+    database_pool_recycle: int = 1800
+    statement_cache_size: int = 1024
     secret_key: str
     algorithm: str
     access_token_expire_minutes: int
+    # Argon2 cost parameters, defaults are the OWASP minimum (19 MiB, t=2, p=1)
+    argon2_memory_kib: int = 19456
+    argon2_time_cost: int = 2
+    argon2_parallelism: int = 1
+    # Hashing processes per uvicorn worker; keep workers x this within the host's cores
+    password_hash_workers: int = 2
 
-    class Config:
-        env_file = ".env"
+    model_config = SettingsConfigDict(env_file=".env")
 
-settings = Settings()
\ No newline at end of file
+@lru_cache
+def get_settings() -> Settings:
+    return Settings()
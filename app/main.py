@@ -1,21 +1,28 @@
+from contextlib import asynccontextmanager
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
-from . import models
-from .database import engine
+from . import utils
 from .routers import post, user, auth, vote
-from .config import settings
 
-# Initialize the database connection and create tables. Commenting this out as Alembic is used for migrations.
-# models.Base.metadata.create_all(bind=engine)
+# The schema is managed by Alembic only; run `alembic upgrade head` before starting the app.
 origins = ['*']
 
-app = FastAPI()
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    # Start the password hashing pool once the worker is up, and stop it on shutdown
+    utils.get_process_pool()
+    yield
+    utils.shutdown_process_pool()
+
+app = FastAPI(lifespan=lifespan)
 app.add_middleware(
     CORSMiddleware,
     allow_origins=origins,
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    # Lets cross-origin clients read the keyset pagination cursor from GET /posts
+    expose_headers=["X-Next-Cursor"],
 )
 
 # Include routers for different functionalities
@@ -25,7 +32,7 @@ app.include_router(auth.router)
 app.include_router(vote.router)
 
 @app.get("/")
-def root():
+async def root():
     return {"message": "Hello World"}
 
 
@@ -1,6 +1,7 @@
 from fastapi import APIRouter, Depends, HTTPException, status, Response
 from fastapi.security.oauth2 import OAuth2PasswordRequestForm
-from sqlalchemy.orm import Session
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
 from .. import schemas, models, utils, oauth2
 from ..database import get_db
 router = APIRouter(
@@ -8,11 +9,11 @@ router = APIRouter(
 )
 
 @router.post('/login', response_model=schemas.Token)
-def login(user_credentials: OAuth2PasswordRequestForm = Depends(), db: Session = Depends(get_db)):
-    user = db.query(models.User).filter(models.User.email == user_credentials.username).first()
+async def login(user_credentials: OAuth2PasswordRequestForm = Depends(), db: AsyncSession = Depends(get_db)):
+    user = (await db.execute(select(models.User).where(models.User.email == user_credentials.username))).scalar_one_or_none()
     if not user:
         raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Invalid credentials")
-    if not utils.verify(user_credentials.password, user.password):
+    if not await utils.verify_async(user_credentials.password, user.password):
         raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Invalid credentials")
     access_token = oauth2.create_access_token(data={"user_id": user.id})
     return {"message": "User logged in successfully", "access_token": access_token, "token_type": "bearer"}
\ No newline at end of file
@@ -1,40 +1,105 @@
+from collections import OrderedDict
+from hashlib import blake2b
 from .. import models, schemas, oauth2
-from fastapi import FastAPI, Response, status, HTTPException, Depends, APIRouter
-from sqlalchemy.orm import Session
-from ..database import engine, get_db
-from typing import Optional, List
-from sqlalchemy import func
+from fastapi import Request, Response, status, HTTPException, Depends, APIRouter
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import selectinload
+from sqlalchemy.orm.attributes import set_committed_value
+from ..database import get_db
+from typing import Annotated, Optional, List
+from pydantic import Field, TypeAdapter
+from sqlalchemy import delete, func, insert, select, update
 
 router = APIRouter(
     prefix="/posts",
     tags=["Posts"]
 )
 
+# Built once at import; validates and serializes a whole page of rows in one pass each
+_post_out_adapter = TypeAdapter(List[schemas.PostOut])
+
+# Correlated count so the LIMIT is applied before votes are counted, one votes(post_id) index lookup per post
+vote_count = select(func.count()).where(models.Vote.post_id == models.Post.id).correlate(models.Post).scalar_subquery().label("votes")
+
+# Serialized get_post bodies keyed on (id, updated_at, votes); any edit or vote changes the key
+POST_JSON_CACHE_SIZE = 1024
+_post_json_cache: OrderedDict = OrderedDict()
+
+def post_etag(post) -> str:
+    digest = blake2b(f"{post.Post.id}:{post.Post.updated_at.timestamp()}:{post.votes}".encode(), digest_size=8).hexdigest()
+    return f'"{digest}"'
+
+def post_json(post) -> bytes:
+    key = (post.Post.id, post.Post.updated_at, post.votes)
+    body = _post_json_cache.get(key)
+    if body is None:
+        body = schemas.PostOut.model_validate(post).model_dump_json().encode()
+        _post_json_cache[key] = body
+        if len(_post_json_cache) > POST_JSON_CACHE_SIZE:
+            _post_json_cache.popitem(last=False)
+    else:
+        _post_json_cache.move_to_end(key)
+    return body
+
+async def raise_missing_or_forbidden(db: AsyncSession, id: int):
+    # Only reached when an owner-scoped UPDATE/DELETE matched nothing, to tell 404 from 403
+    exists = (await db.execute(select(models.Post.id).where(models.Post.id == id))).scalar_one_or_none()
+    if exists is None:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=f"Post with id {id} not found")
+    raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Not authorized to perform requested action")
+
 @router.get("/", response_model=List[schemas.PostOut])
-def get_posts(db: Session = Depends(get_db), current_user: int = Depends(oauth2.get_current_user), limit: int = 10, skip: int = 0, search: Optional[str]= ""):
-    posts = db.query(models.Post, func.count(models.Vote.post_id).label("votes")).join(models.Vote, models.Post.id == models.Vote.post_id, isouter=True).group_by(models.Post.id).filter(models.Post.title.contains(search)).limit(limit).offset(skip).all()
+async def get_posts(db: AsyncSession = Depends(get_db), current_user: models.User = Depends(oauth2.get_current_user), limit: int = 10, skip: int = 0, search: Optional[str]= "", after_id: Optional[int] = None):
+    if after_id is not None and skip:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Use either skip or after_id, not both")
+    query = select(models.Post, vote_count).options(selectinload(models.Post.owner)).order_by(models.Post.id).limit(limit)
+    if search:
+        # ILIKE can use the pg_trgm GIN index on posts.title; a plain LIKE '%...%' cannot use a B-tree index
+        query = query.where(models.Post.title.ilike(f"%{search}%"))
+    # Keyset pagination: seek past the last id of the previous page instead of scanning and discarding `skip` rows
+    if after_id is not None:
+        query = query.where(models.Post.id > after_id)
+    else:
+        query = query.offset(skip)
+    result = await db.execute(query)
+    posts = result.all()
+    headers = {}
+    if posts and len(posts) == limit:
+        headers["X-Next-Cursor"] = str(posts[-1].Post.id)
     # posts =db.query(models.Post).filter(models.Post.owner_id == current_user.id).filter(models.Post.title.contains(search)).limit(limit).offset(skip).all()
     # cursor.execute("""SELECT * FROM posts""")
     # posts = cursor.fetchall()
-    return posts
+    # Returning a Response skips FastAPI's dump-and-revalidate against response_model, which only documents the shape here
+    return Response(content=_post_out_adapter.dump_json(_post_out_adapter.validate_python(posts)), media_type="application/json", headers=headers)
 
 @router.post("/", status_code=status.HTTP_201_CREATED, response_model=schemas.Post)
-def create_posts(post: schemas.PostCreate, db: Session = Depends(get_db), current_user: int = Depends(oauth2.get_current_user)):
+async def create_posts(post: schemas.PostCreate, db: AsyncSession = Depends(get_db), current_user: models.User = Depends(oauth2.get_current_user)):
     print(f"User ID: {current_user.email}")  # Debugging line to check the user ID
     # new_post = models.Post(title=post.title, content=post.content, published=post.published)
-    new_post = models.Post(owner_id=current_user.id, **post.dict()) # Unpacking the Post model to match the database schema
-    db.add(new_post)
-    db.commit()
-    db.refresh(new_post)
+    # INSERT ... RETURNING fetches server defaults (id, created_at) in the same round-trip, no refresh needed
+    new_post = (await db.execute(insert(models.Post).values(owner_id=current_user.id, **post.model_dump()).returning(models.Post))).scalar_one() # Unpacking the Post model to match the database schema
+    await db.commit()
+    # The owner is the authenticated user already in hand, so attach it rather than SELECT it again
+    set_committed_value(new_post, "owner", current_user)
     # cursor.execute("""INSERT INTO posts (title, content, published) VALUES (%s, %s, %s) RETURNING *""", (post.title, post.content, post.published))
     # new_post = cursor.fetchone()
     # conn.commit()
     return new_post
 
+@router.post("/bulk", status_code=status.HTTP_201_CREATED, response_model=List[schemas.Post])
+async def create_posts_bulk(posts: Annotated[List[schemas.PostCreate], Field(min_length=1, max_length=100)], db: AsyncSession = Depends(get_db), current_user: models.User = Depends(oauth2.get_current_user)):
+    # One executemany: the driver batches the rows into multi-row INSERT ... RETURNING statements
+    new_posts = (await db.scalars(insert(models.Post).returning(models.Post, sort_by_parameter_order=True), [{**post.model_dump(), "owner_id": current_user.id} for post in posts])).all()
+    await db.commit()
+    for new_post in new_posts:
+        set_committed_value(new_post, "owner", current_user)
+    return new_posts
+
 @router.get("/{id}", response_model = schemas.PostOut)
-def get_post(id: int, db: Session = Depends(get_db)):
+async def get_post(id: int, request: Request, db: AsyncSession = Depends(get_db)):
     # post = db.query(models.Post).filter(models.Post.id == id).first()
-    post = db.query(models.Post, func.count(models.Vote.post_id).label("votes")).join(models.Vote, models.Post.id == models.Vote.post_id, isouter=True).group_by(models.Post.id).filter(models.Post.id == id).first()
+    result = await db.execute(select(models.Post, vote_count).where(models.Post.id == id).options(selectinload(models.Post.owner)))
+    post = result.first()
 
     # Uncomment the following lines if you want to use raw SQL queries instead of SQLAlchemy
     # cursor.execute("""SELECT * FROM posts WHERE id = %s""", (str(id)))
@@ -44,35 +109,35 @@ def get_post(id: int, db: Session = Depends(get_db)):
         # Alternatively, you can use the commented lines below to return a custom response
         # response.status_code = status.HTTP_404_NOT_FOUND
         # return {"message": f"Post with id {id} not found"}
-    return post
+    # Clients revalidate every time (votes change without touching the post), but unchanged posts cost no body
+    headers = {"ETag": post_etag(post), "Cache-Control": "no-cache"}
+    if_none_match = request.headers.get("if-none-match")
+    if if_none_match and (if_none_match.strip() == "*" or headers["ETag"] in [tag.strip().removeprefix("W/") for tag in if_none_match.split(",")]):
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+    return Response(content=post_json(post), media_type="application/json", headers=headers)
 
 @router.delete("/{id}", status_code = status.HTTP_204_NO_CONTENT)
-def delete_post(id: int, db: Session = Depends(get_db), current_user: int = Depends(oauth2.get_current_user)):
-    post = db.query(models.Post).filter(models.Post.id == id)
-    deleted_post = post.first()
+async def delete_post(id: int, db: AsyncSession = Depends(get_db), current_user: models.User = Depends(oauth2.get_current_user)):
+    # Single round-trip: the ownership check is part of the DELETE itself
+    deleted_id = (await db.execute(delete(models.Post).where(models.Post.id == id, models.Post.owner_id == current_user.id).returning(models.Post.id))).scalar_one_or_none()
 
     # cursor.execute("""DELETE FROM posts WHERE id = %s RETURNING *""", (str(id)))
     # deleted_post = cursor.fetchone()
     # conn.commit()
-    if not deleted_post:
-        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=f"Post with id {id} not found")
-    if deleted_post.owner_id != current_user.id:
-        raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Not authorized to perform requested action")
-    post.delete(synchronize_session=False)
-    db.commit()
+    if deleted_id is None:
+        await raise_missing_or_forbidden(db, id)
+    await db.commit()
     return Response(status_code=status.HTTP_204_NO_CONTENT)
 
 @router.put("/{id}", response_model=schemas.Post)
-def update_post(id:int, post: schemas.PostCreate, db: Session = Depends(get_db), current_user: int = Depends(oauth2.get_current_user)):
-    post_query = db.query(models.Post).filter(models.Post.id == id)
-    updated_post = post_query.first()
+async def update_post(id:int, post: schemas.PostCreate, db: AsyncSession = Depends(get_db), current_user: models.User = Depends(oauth2.get_current_user)):
+    # Single round-trip: the ownership check is part of the UPDATE itself
+    updated_post = (await db.execute(update(models.Post).where(models.Post.id == id, models.Post.owner_id == current_user.id).values(**post.model_dump()).returning(models.Post))).scalar_one_or_none()
     # cursor.execute("""UPDATE posts SET title = %s, content = %s, published = %s WHERE id = %s RETURNING *""", (post.title, post.content, post.published, str(id)))
     # updated_post = cursor.fetchone()
     # conn.commit()
     if updated_post is None:
-        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=f"Post with id {id} not found")
-    if updated_post.owner_id != current_user.id:
-        raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Not authorized to perform requested action")
-    post_query.update(post.dict(), synchronize_session=False)
-    db.commit()
-    return post_query.first()
\ No newline at end of file
+        await raise_missing_or_forbidden(db, id)
+    await db.commit()
+    set_committed_value(updated_post, "owner", current_user)
+    return updated_post
@@ -1,7 +1,8 @@
 from .. import models, schemas, utils
-from fastapi import FastAPI, Response, status, HTTPException, Depends, APIRouter
-from sqlalchemy.orm import Session
-from ..database import engine, get_db
+from fastapi import status, HTTPException, Depends, APIRouter
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+from ..database import get_db
 
 router = APIRouter(
     prefix="/users",
@@ -9,26 +10,26 @@ router = APIRouter(
 )
 
 @router.post("/", status_code=status.HTTP_201_CREATED, response_model=schemas.UserOut)
-def create_user(user: schemas.UserCreate, db: Session = Depends(get_db)):
+async def create_user(user: schemas.UserCreate, db: AsyncSession = Depends(get_db)):
+    # Check if the email already exists (before hashing, so duplicates don't cost a hash)
+    existing_user = (await db.execute(select(models.User).where(models.User.email == user.email))).scalar_one_or_none()
+    if existing_user:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Email already registered")
+
     # Hash the password
-    hashed_password = utils.hash(user.password)
+    hashed_password = await utils.hash_async(user.password)
     user.password = hashed_password
 
-    # Check if the email already exists
-    existing_user = db.query(models.User).filter(models.User.email == user.email).first()
-    if existing_user:
-        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Email already registered")
-    
     # Create a new user
-    new_user = models.User(**user.dict()) # Unpacking the Post model to match the database schema
+    new_user = models.User(**user.model_dump()) # Unpacking the Post model to match the database schema
     db.add(new_user)
-    db.commit()
-    db.refresh(new_user)
+    await db.commit()
+    await db.refresh(new_user)
     return new_user
 
 @router.get("/{id}", response_model=schemas.UserOut)
-def get_user(id: int, db: Session = Depends(get_db)):
-    user = db.query(models.User).filter(models.User.id == id).first()
+async def get_user(id: int, db: AsyncSession = Depends(get_db)):
+    user = (await db.execute(select(models.User).where(models.User.id == id))).scalar_one_or_none()
     if not user:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=f"User with id {id} not found")
     return user
@@ -1,5 +1,6 @@
 from fastapi import APIRouter, Depends, HTTPException, status
-from sqlalchemy.orm import Session
+from sqlalchemy import delete, select
+from sqlalchemy.ext.asyncio import AsyncSession
 
 from .. import models, schemas, oauth2
 from ..database import get_db
@@ -10,26 +11,25 @@ router = APIRouter(
 )
 
 @router.post("/", status_code=status.HTTP_201_CREATED)
-def vote(vote: schemas.Vote, db: Session = Depends(get_db), current_user: int = Depends(oauth2.get_current_user)):
-    post = db.query(models.Post).filter(models.Post.id == vote.post_id).first()
+async def vote(vote: schemas.Vote, db: AsyncSession = Depends(get_db), current_user: models.User = Depends(oauth2.get_current_user)):
+    post = (await db.execute(select(models.Post).where(models.Post.id == vote.post_id))).scalar_one_or_none()
     if not post:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=f"Post with id {vote.post_id} does not exist")
-    vote_query = db.query(models.Vote).filter(
+    vote_filter = (
             models.Vote.post_id == vote.post_id,
             models.Vote.user_id == current_user.id
         )
-    found_vote = vote_query.first()
+    found_vote = (await db.execute(select(models.Vote).where(*vote_filter))).scalar_one_or_none()
     if vote.dir == 1:
         if found_vote:
             raise HTTPException(status_code=status.HTTP_409_CONFLICT, detail="Vote already exists")
         new_vote = models.Vote(post_id=vote.post_id, user_id=current_user.id)
         db.add(new_vote)
-        db.commit()
-        db.refresh(new_vote)
+        await db.commit()
         return {"message": "Vote added successfully"}
     else:
         if not found_vote:
             raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Vote does not exist")
-        vote_query.delete(synchronize_session=False)
-        db.commit()
+        await db.execute(delete(models.Vote).where(*vote_filter))
+        await db.commit()
         return {"message": "Vote deleted successfully"}
\ No newline at end of file
@@ -1,6 +1,6 @@
 from datetime import datetime
 from typing import Optional
-from pydantic import BaseModel, EmailStr
+from pydantic import BaseModel, ConfigDict, EmailStr
 from pydantic.types import conint
 
 class UserCreate(BaseModel):
@@ -12,8 +12,7 @@ class UserOut(BaseModel):
     email: EmailStr
     created_at: datetime
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
 
 class UserLogin(BaseModel):
     email: EmailStr
@@ -40,18 +39,16 @@ class Post(PostBase):
     owner_id: int
     owner: UserOut
 
-    class Config:
-        from_attributes = True
-        # This allows Pydantic to read data from SQLAlchemy models and convert them to Pydantic models
-        # without needing to convert them to dictionaries first.
-        # It is useful when you want to return SQLAlchemy models directly in your FastAPI endpoints.   
+    model_config = ConfigDict(from_attributes=True)
+    # This allows Pydantic to read data from SQLAlchemy models and convert them to Pydantic models
+    # without needing to convert them to dictionaries first.
+    # It is useful when you want to return SQLAlchemy models directly in your FastAPI endpoints.   
 
 class PostOut(BaseModel):
     Post: Post
     votes: int
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
 
 class Vote(BaseModel):
     post_id : int
@@ -1,12 +1,53 @@
+import asyncio
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
+from typing import Optional
 # from passlib.context import CryptContext
 from passlib.hash import argon2
+from .config import get_settings
 
 # Hashing algorithm(bcrypt)for passwords
 # pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
-pwd_context = argon2
+
+# Argon2 hasher, built on first use (in each hashing process) from the current settings
+@lru_cache
+def get_pwd_context():
+    settings = get_settings()
+    return argon2.using(
+        memory_cost=settings.argon2_memory_kib,
+        time_cost=settings.argon2_time_cost,
+        parallelism=settings.argon2_parallelism,
+    )
 
 def hash(password: str):
-    return pwd_context.hash(password)
+    return get_pwd_context().hash(password)
 
 def verify(plain_password: str, hashed_password: str):
-    return pwd_context.verify(plain_password, hashed_password)
\ No newline at end of file
+    return get_pwd_context().verify(plain_password, hashed_password)
+
+# Hashing is CPU-bound, so it runs in worker processes to keep the event loop free.
+# The pool is created on first use (normally by the app lifespan) and uses forkserver,
+# so children don't inherit the event loop, threads or open DB sockets of a running worker.
+_process_pool: Optional[ProcessPoolExecutor] = None
+
+def get_process_pool() -> ProcessPoolExecutor:
+    global _process_pool
+    if _process_pool is None:
+        _process_pool = ProcessPoolExecutor(
+            max_workers=get_settings().password_hash_workers,
+            mp_context=multiprocessing.get_context("forkserver"),
+        )
+    return _process_pool
+
+def shutdown_process_pool():
+    global _process_pool
+    if _process_pool is not None:
+        _process_pool.shutdown()
+        _process_pool = None
+
+async def hash_async(password: str):
+    return await asyncio.get_running_loop().run_in_executor(get_process_pool(), hash, password)
+
+async def verify_async(plain_password: str, hashed_password: str):
+    return await asyncio.get_running_loop().run_in_executor(get_process_pool(), verify, plain_password, hashed_password)